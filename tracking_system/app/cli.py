@@ -0,0 +1,72 @@
+import argparse
+import asyncio
+from datetime import datetime
+from pathlib import Path
+
+from app.services.export_service import (
+    ExportFormat,
+    ExportTable,
+    export_snapshot,
+    stream_export,
+)
+
+
+async def export(
+    tables: list[ExportTable],
+    export_format: ExportFormat,
+    since: datetime | None,
+    output_dir: Path,
+):
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # All tables are read from the same snapshot so they are consistent
+    async with export_snapshot() as (conn, watermark):
+        for table in tables:
+            path = output_dir / f"{table.value}.{export_format.value}"
+            with path.open("wb") as output:
+                async for chunk in stream_export(conn, table, export_format, since):
+                    output.write(chunk)
+            print(f"Exported {table.value} to {path}")
+
+    # Pass this as --since on the next incremental export
+    print(f"Watermark: {watermark.isoformat()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m app.cli")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = subparsers.add_parser(
+        "export", help="Export order, sample, QC and shipment data"
+    )
+    export_parser.add_argument(
+        "--table",
+        action="append",
+        type=ExportTable,
+        choices=list(ExportTable),
+        metavar="{" + ",".join(table.value for table in ExportTable) + "}",
+        help="Table to export, may be repeated (default: all tables)",
+    )
+    export_parser.add_argument(
+        "--format",
+        type=ExportFormat,
+        choices=list(ExportFormat),
+        metavar="{" + ",".join(fmt.value for fmt in ExportFormat) + "}",
+        default=ExportFormat.CSV,
+    )
+    export_parser.add_argument(
+        "--since",
+        type=datetime.fromisoformat,
+        help="Only export rows created/updated at or after this UTC watermark",
+    )
+    export_parser.add_argument("--output-dir", type=Path, default=Path("export"))
+
+    args = parser.parse_args()
+
+    asyncio.run(
+        export(args.table or list(ExportTable), args.format, args.since, args.output_dir)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,8 @@ from fastapi import FastAPI
 from contextlib import asynccontextmanager
 
 from app.db import init_db
-from app.routes import health, orders, samples
+from app.middleware import PathGZipMiddleware
+from app.routes import export, health, orders, samples
 
 
 @asynccontextmanager
@@ -15,6 +16,15 @@ async def lifespan(app: FastAPI):
 
 app = FastAPI(lifespan=lifespan)
 
+# Compress large polling list bodies for clients that accept gzip; a low
+# level keeps the cost per poll small
+app.add_middleware(
+    PathGZipMiddleware,
+    paths={"/samples/to-process/", "/samples/plate-layout/", "/samples/to-ship/"},
+    compresslevel=1,
+)
+
 app.include_router(health.router, tags=["health"])
 app.include_router(orders.router, tags=["orders"])
 app.include_router(samples.router, tags=["samples"])
+app.include_router(export.router, tags=["export"])
@@ -0,0 +1,30 @@
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class PathGZipMiddleware:
+    """
+    Gzip responses for the given paths only.
+
+    Keeps compression off streaming exports, which are large, often already
+    compressed (Parquet) and would otherwise be compressed on the event loop.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        paths: set[str],
+        minimum_size: int = 1000,
+        compresslevel: int = 1,
+    ):
+        self.app = app
+        self.paths = paths
+        self.gzip = GZipMiddleware(
+            app, minimum_size=minimum_size, compresslevel=compresslevel
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in self.paths:
+            await self.gzip(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
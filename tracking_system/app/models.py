@@ -3,6 +3,7 @@ from enum import Enum
 from typing import List, Optional
 from uuid import UUID
 
+from sqlalchemy import Index, text
 from sqlmodel import Field, Relationship, SQLModel
 
 class SampleStatus(str, Enum):
@@ -20,24 +21,41 @@ class Order(SQLModel, table=True):
     order_id: Optional[int] = Field(default=None, primary_key=True)
     order_uuid: UUID = Field(unique=True, index=True)
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow, index=True)
 
     samples: List["Sample"] = Relationship(back_populates="order")
 
 class Sample(SQLModel, table=True):
+    __table_args__ = (
+        # Serves the to-process queue and plate scheduler oldest-first
+        Index(
+            "ix_sample_ordered_created_at",
+            "created_at",
+            "sample_uuid",
+            postgresql_where=text("status = 'ORDERED'"),
+        ),
+    )
+
     sample_id: Optional[int] = Field(default=None, primary_key=True)
     sample_uuid: UUID = Field(unique=True, index=True)
     order_id: int = Field(foreign_key="order.order_id", index=True)
     sequence: str
+    sequence_length: int = Field(default=0, sa_column_kwargs={"server_default": "0"})
+    gc_content: float = Field(default=0.0, sa_column_kwargs={"server_default": "0"})
     status: SampleStatus = Field(default=SampleStatus.ORDERED)
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow, index=True)
 
     order: Order = Relationship(back_populates="samples")
     qc_result: Optional["QCResults"] = Relationship(back_populates="sample")
     shipment: Optional["Shipment"] = Relationship(back_populates="sample")
 
 class QCResults(SQLModel, table=True):
+    __table_args__ = (
+        # Append-only, so a BRIN index stays correlated for export scans
+        Index("ix_qcresults_created_at_brin", "created_at", postgresql_using="brin"),
+    )
+
     qc_id: Optional[int] = Field(default=None, primary_key=True)
     sample_id: int = Field(foreign_key="sample.sample_id", index=True)
     plate_id: int
@@ -50,8 +68,16 @@ class QCResults(SQLModel, table=True):
     sample: Sample = Relationship(back_populates="qc_result")
 
 class Shipment(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_shipment_shipped_at_brin", "shipped_at", postgresql_using="brin"),
+    )
+
     shipment_id: Optional[int] = Field(default=None, primary_key=True)
     sample_id: int = Field(foreign_key="sample.sample_id", index=True)
     shipped_at: datetime = Field(default_factory=datetime.utcnow)
 
     sample: Sample = Relationship(back_populates="shipment")
+
+class QueueVersion(SQLModel, table=True):
+    queue: str = Field(primary_key=True)
+    version: int = Field(default=0)
@@ -0,0 +1,56 @@
+from contextlib import AsyncExitStack
+from datetime import datetime
+
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+
+from app.services.export_service import (
+    MEDIA_TYPES,
+    ExportFormat,
+    ExportTable,
+    export_snapshot,
+    stream_export,
+)
+
+router = APIRouter()
+
+
+class SnapshotStreamingResponse(StreamingResponse):
+    # Releases the export snapshot however the response ends: completed,
+    # client disconnected, or failed before the body was ever iterated
+    def __init__(self, *args, stack: AsyncExitStack, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stack = stack
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            # Close the cursor before the connection it runs on
+            await self.body_iterator.aclose()
+            await self.stack.aclose()
+
+
+@router.get("/export/{table}")
+async def export_table(
+    table: ExportTable,
+    format: ExportFormat = ExportFormat.CSV,
+    since: datetime | None = None,
+):
+    # The snapshot is opened here so its watermark can be sent as a header
+    stack = AsyncExitStack()
+    conn, watermark = await stack.enter_async_context(export_snapshot())
+    try:
+        return SnapshotStreamingResponse(
+            stream_export(conn, table, format, since),
+            stack=stack,
+            media_type=MEDIA_TYPES[format],
+            headers={
+                "Content-Disposition": f'attachment; filename="{table.value}.{format.value}"',
+                "X-Export-Watermark": watermark.isoformat(),
+            },
+        )
+    except BaseException:
+        await stack.aclose()
+        raise
@@ -1,9 +1,12 @@
-from fastapi import APIRouter, Depends
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.db import get_session
 from app.schemas.pydantic_models import (
     SamplesToMakeResponse,
+    PlateLayoutsResponse,
     QCResultsInput,
     SamplesToShipResponse,
     SamplesShippedInput,
@@ -12,11 +15,15 @@ from app.schemas.pydantic_models import (
 )
 from app.services.sample_service import (
     get_samples_to_process,
+    get_plate_layouts,
+    get_newest_overdue_created_at,
     log_qc_results,
     get_samples_to_ship,
     record_samples_shipped,
     get_sample_tat_status
 )
+from app.services.plate_layout import MAX_QUEUE_AGE, PlateFormat
+from app.services.queue_version import Queue, check_not_modified
 
 router = APIRouter()
 
@@ -31,10 +38,37 @@ async def get_sample_status_route(
 
 
 @router.get("/samples/to-process/", response_model=SamplesToMakeResponse)
-async def list_samples_to_process(session: AsyncSession = Depends(get_session)):
+async def list_samples_to_process(
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_session),
+):
+    not_modified = await check_not_modified(request, response, session, Queue.TO_PROCESS)
+    if not_modified is not None:
+        return not_modified
     return await get_samples_to_process(session)
 
 
+@router.get("/samples/plate-layout/", response_model=PlateLayoutsResponse)
+async def list_plate_layouts(
+    request: Request,
+    response: Response,
+    plate_format: PlateFormat = PlateFormat.PLATE_96,
+    plates: int = Query(default=1, ge=1, le=16),
+    session: AsyncSession = Depends(get_session),
+):
+    # Layouts also change when samples become overdue, which involves no
+    # write, so the newest overdue sample is part of the tag
+    overdue_before = datetime.utcnow() - MAX_QUEUE_AGE
+    newest_overdue = await get_newest_overdue_created_at(session, overdue_before)
+    not_modified = await check_not_modified(
+        request, response, session, Queue.TO_PROCESS, newest_overdue
+    )
+    if not_modified is not None:
+        return not_modified
+    return await get_plate_layouts(session, plate_format, plates, overdue_before)
+
+
 @router.post("/samples/qc-results/")
 async def log_qc_results_route(
     qc_results_input: QCResultsInput, session: AsyncSession = Depends(get_session)
@@ -43,7 +77,14 @@ async def log_qc_results_route(
 
 
 @router.get("/samples/to-ship/", response_model=SamplesToShipResponse)
-async def list_samples_to_ship(session: AsyncSession = Depends(get_session)):
+async def list_samples_to_ship(
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_session),
+):
+    not_modified = await check_not_modified(request, response, session, Queue.TO_SHIP)
+    if not_modified is not None:
+        return not_modified
     return await get_samples_to_ship(session)
 
 
@@ -30,6 +30,22 @@ class SamplesToMakeResponse(BaseModel):
     samples_to_make: list[SampleToMake]
 
 
+class PlateWell(BaseModel):
+    well: str
+    sample_uuid: UUID
+    sequence: str
+    created_at: str
+
+
+class PlateLayout(BaseModel):
+    plate_format: int
+    wells: list[PlateWell]
+
+
+class PlateLayoutsResponse(BaseModel):
+    plates: list[PlateLayout]
+
+
 class QCResultInput(BaseModel):
     sample_uuid: UUID
     plate_id: int
@@ -0,0 +1,251 @@
+import asyncio
+import io
+from contextlib import aclosing, asynccontextmanager, suppress
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import AsyncIterable, AsyncIterator
+
+import anyio
+import pyarrow as pa
+import pyarrow.parquet as pq
+import sqlalchemy as sa
+from sqlalchemy.engine import Dialect
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.db import engine
+from app.models import Order, QCResults, Sample, Shipment
+
+EXPORT_BATCH_SIZE = 50_000
+
+# COPY output chunks buffered between the database and the response; bounds
+# memory when the client reads slower than Postgres writes
+COPY_QUEUE_SIZE = 64
+
+# Row timestamps are taken from the application clock before commit, so the
+# watermark is moved back by this much to cover clock skew between app and DB
+EXPORT_WATERMARK_OVERLAP = timedelta(minutes=5)
+
+# Start of the oldest transaction still in flight (or of the snapshot itself);
+# rows those transactions commit later can carry timestamps from that point on
+WATERMARK_QUERY = sa.text(
+    """
+    SELECT timezone('UTC', least(now(), min(xact_start)))
+    FROM pg_stat_activity
+    WHERE datname = current_database()
+      AND pid <> pg_backend_pid()
+      AND xact_start IS NOT NULL
+    """
+)
+
+
+class ExportTable(str, Enum):
+    ORDER = "order"
+    SAMPLE = "sample"
+    QCRESULTS = "qcresults"
+    SHIPMENT = "shipment"
+
+
+class ExportFormat(str, Enum):
+    CSV = "csv"
+    PARQUET = "parquet"
+
+
+# Table and the column used as the incremental export watermark
+EXPORT_SOURCES = {
+    ExportTable.ORDER: (Order.__table__, "updated_at"),
+    ExportTable.SAMPLE: (Sample.__table__, "updated_at"),
+    ExportTable.QCRESULTS: (QCResults.__table__, "created_at"),
+    ExportTable.SHIPMENT: (Shipment.__table__, "shipped_at"),
+}
+
+MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+}
+
+
+@asynccontextmanager
+async def export_snapshot() -> AsyncIterator[tuple[AsyncConnection, datetime]]:
+    """
+    Open a read-only REPEATABLE READ transaction so every table exported
+    through the connection sees the same snapshot.
+
+    Also yields a conservative watermark (naive UTC) to pass as `since` on
+    the next incremental export: rows written by transactions that were still
+    open when the snapshot was taken are exported again next time rather than
+    lost, so consumers should upsert on the primary key.
+    """
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="REPEATABLE READ")
+        async with conn.begin():
+            await conn.execute(sa.text("SET TRANSACTION READ ONLY"))
+            watermark = await conn.scalar(WATERMARK_QUERY)
+            yield conn, watermark - EXPORT_WATERMARK_OVERLAP
+
+
+def _to_naive_utc(value: datetime) -> datetime:
+    # Timestamp columns are naive UTC, which asyncpg cannot compare with
+    # timezone-aware parameters
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def _export_query(table: ExportTable, since: datetime | None):
+    source, watermark_column = EXPORT_SOURCES[table]
+    # UUID and enum columns are cast to text in the database so that rows
+    # can be written without per-value conversion in Python
+    columns = [
+        (
+            sa.cast(column, sa.String).label(column.name)
+            if isinstance(column.type, (sa.Uuid, sa.Enum))
+            else column
+        )
+        for column in source.columns
+    ]
+    query = sa.select(*columns).order_by(*source.primary_key.columns)
+    if since is not None:
+        query = query.where(source.columns[watermark_column] >= _to_naive_utc(since))
+    return query
+
+
+def _copy_statement(
+    table: ExportTable, since: datetime | None, dialect: Dialect
+) -> tuple[str, list]:
+    # Compiled for asyncpg, so parameters are positional ($1, ...)
+    compiled = _export_query(table, since).compile(dialect=dialect)
+    args = [compiled.params[name] for name in compiled.positiontup]
+    return str(compiled), args
+
+
+async def _copy_csv(
+    conn: AsyncConnection, table: ExportTable, since: datetime | None
+) -> AsyncIterator[bytes]:
+    """
+    Stream CSV produced by Postgres itself (COPY ... TO STDOUT), inside the
+    snapshot transaction, so rows are never formatted on the event loop.
+    """
+    sql, args = _copy_statement(table, since, conn.dialect)
+    raw_connection = await conn.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+
+    chunks: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=COPY_QUEUE_SIZE)
+
+    async def copy():
+        try:
+            await driver_connection.copy_from_query(
+                sql, *args, output=chunks.put, format="csv", header=True
+            )
+        finally:
+            await chunks.put(None)
+
+    task = asyncio.create_task(copy())
+    try:
+        while (chunk := await chunks.get()) is not None:
+            yield chunk
+        # Surface errors from COPY once its output is drained
+        await task
+    finally:
+        if not task.done():
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+
+async def _stream_batches(
+    conn: AsyncConnection, table: ExportTable, since: datetime | None
+) -> AsyncIterator[list[sa.Row]]:
+    # Server-side cursor: only one batch is held in memory at a time
+    query = _export_query(table, since).execution_options(yield_per=EXPORT_BATCH_SIZE)
+    result = await conn.stream(query)
+    try:
+        async for batch in result.partitions(EXPORT_BATCH_SIZE):
+            yield batch
+    finally:
+        await result.close()
+
+
+class _ChunkSink(io.RawIOBase):
+    # Write-only file object that hands written bytes back in chunks while
+    # reporting the absolute position, which Parquet needs for its footer
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        chunk = b"".join(self._chunks)
+        self._chunks.clear()
+        return chunk
+
+
+def _arrow_schema(table: ExportTable) -> pa.Schema:
+    source, _ = EXPORT_SOURCES[table]
+    fields = []
+    for column in source.columns:
+        if isinstance(column.type, (sa.Uuid, sa.Enum)):
+            arrow_type = pa.string()
+        elif isinstance(column.type, sa.Integer):
+            arrow_type = pa.int64()
+        elif isinstance(column.type, sa.Float):
+            arrow_type = pa.float64()
+        elif isinstance(column.type, sa.DateTime):
+            arrow_type = pa.timestamp("us")
+        else:
+            arrow_type = pa.string()
+        fields.append(pa.field(column.name, arrow_type, nullable=column.nullable))
+    return pa.schema(fields)
+
+
+def _write_row_group(
+    writer: pq.ParquetWriter, schema: pa.Schema, batch: list[sa.Row]
+) -> None:
+    columns = list(zip(*batch))
+    writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+
+
+async def _write_parquet(
+    table: ExportTable, batches: AsyncIterable[list[sa.Row]]
+) -> AsyncIterator[bytes]:
+    schema = _arrow_schema(table)
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression="snappy")
+
+    # One row group per batch, encoded in a worker thread so the event loop
+    # keeps serving polls while an export runs
+    async for batch in batches:
+        await anyio.to_thread.run_sync(_write_row_group, writer, schema, batch)
+        yield sink.drain()
+
+    await anyio.to_thread.run_sync(writer.close)
+    yield sink.drain()
+
+
+async def stream_export(
+    conn: AsyncConnection,
+    table: ExportTable,
+    export_format: ExportFormat,
+    since: datetime | None = None,
+) -> AsyncIterator[bytes]:
+    # Inner generators are closed explicitly, so the cursor or COPY is
+    # finished before the connection goes back to the pool
+    if export_format == ExportFormat.PARQUET:
+        async with aclosing(_stream_batches(conn, table, since)) as batches:
+            async with aclosing(_write_parquet(table, batches)) as stream:
+                async for chunk in stream:
+                    yield chunk
+    else:
+        async with aclosing(_copy_csv(conn, table, since)) as stream:
+            async for chunk in stream:
+                yield chunk
@@ -1,11 +1,12 @@
 import json
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from fastapi import HTTPException
 from fastapi.responses import JSONResponse
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.ids import uuid7
 from app.models import Order, Sample, SampleStatus
 from app.schemas.pydantic_models import (
     OrderInput,
@@ -13,6 +14,8 @@ from app.schemas.pydantic_models import (
     OrderStatusResponse,
     SampleStatusResponse,
 )
+from app.services.plate_layout import compute_sequence_features
+from app.services.queue_version import Queue, bump_queue_versions
 
 
 class UUIDEncoder(json.JSONEncoder):
@@ -44,20 +47,24 @@ async def create_order(order_input: OrderInput, session: AsyncSession):
         )
 
     # Create new order
-    new_order = Order(order_uuid=uuid4())
+    new_order = Order(order_uuid=uuid7())
     session.add(new_order)
     await session.flush()  # This will assign an order_id to new_order
 
     # Create samples
     for sample_input in order_input.order:
+        sequence_length, gc_content = compute_sequence_features(sample_input.sequence)
         new_sample = Sample(
             sample_uuid=sample_input.sample_uuid,
             order_id=new_order.order_id,
             sequence=sample_input.sequence,
+            sequence_length=sequence_length,
+            gc_content=gc_content,
             status=SampleStatus.ORDERED,
         )
         session.add(new_sample)
 
+    await bump_queue_versions(session, Queue.TO_PROCESS)
     await session.commit()
 
     return OrderResponse(order_uuid=new_order.order_uuid)
@@ -0,0 +1,111 @@
+from datetime import timedelta
+from enum import IntEnum
+from string import ascii_uppercase
+from typing import Callable, Sequence, TypeVar
+
+
+class PlateFormat(IntEnum):
+    PLATE_96 = 96
+    PLATE_384 = 384
+
+
+# (rows, columns) for each supported plate format
+PLATE_DIMENSIONS = {
+    PlateFormat.PLATE_96: (8, 12),
+    PlateFormat.PLATE_384: (16, 24),
+}
+
+# Samples whose lengths fall in the same bucket are considered compatible
+# on a synthesizer run; GC content is used as a tie-breaker between samples
+# at the same length distance from a plate's seed.
+LENGTH_BUCKET_SIZE = 50
+GC_BUCKET_SIZE = 0.05
+
+# Plates are chosen from an oldest-first window this many times larger than
+# the capacity requested, which bounds the work per call
+CANDIDATE_WINDOW_FACTOR = 8
+
+# Samples older than this are placed on the next plate regardless of bucket,
+# so rare lengths are never starved
+MAX_QUEUE_AGE = timedelta(hours=24)
+
+T = TypeVar("T")
+
+
+def compute_sequence_features(sequence: str) -> tuple[int, float]:
+    # Precomputed once at order time so the scheduler never has to scan sequences
+    length = len(sequence)
+    if length == 0:
+        return 0, 0.0
+    upper = sequence.upper()
+    gc_count = upper.count("G") + upper.count("C")
+    return length, gc_count / length
+
+
+def well_names(plate_format: PlateFormat) -> list[str]:
+    # Row-major order: A1, A2, ..., A12, B1, ...
+    rows, columns = PLATE_DIMENSIONS[plate_format]
+    return [
+        f"{ascii_uppercase[row]}{column}"
+        for row in range(rows)
+        for column in range(1, columns + 1)
+    ]
+
+
+def layout_key(sequence_length: int, gc_content: float) -> tuple[int, int]:
+    return (
+        sequence_length // LENGTH_BUCKET_SIZE,
+        int(gc_content / GC_BUCKET_SIZE),
+    )
+
+
+def seed_distance(seed: tuple[int, int], key: tuple[int, int]) -> tuple[int, int]:
+    # Length first; GC only orders samples at the same length distance
+    return abs(seed[0] - key[0]), abs(seed[1] - key[1])
+
+
+def candidate_window(plate_format: PlateFormat, plates: int) -> int:
+    return int(plate_format) * plates * CANDIDATE_WINDOW_FACTOR
+
+
+def pack_plates(
+    samples: Sequence[T],
+    plate_format: PlateFormat,
+    plates: int,
+    features: Callable[[T], tuple[int, float]],
+    is_overdue: Callable[[T], bool],
+) -> list[list[tuple[str, T]]]:
+    """
+    Build up to `plates` full plates from an oldest-first candidate window.
+
+    Each plate is seeded with the oldest remaining sample. Overdue samples go
+    on first, then the plate is filled outwards from the seed's bucket, one
+    length step at a time, until it is full. Anything not placed stays in the
+    queue.
+    """
+    plate_size = int(plate_format)
+    keys = [layout_key(*features(sample)) for sample in samples]
+    overdue = [is_overdue(sample) for sample in samples]
+    remaining = list(range(len(samples)))
+    wells = well_names(plate_format)
+    packed = []
+
+    while len(packed) < plates and len(remaining) >= plate_size:
+        # The window is oldest-first, so remaining[0] is the oldest sample
+        seed_key = keys[remaining[0]]
+        chosen = sorted(
+            remaining,
+            key=lambda index: (
+                not overdue[index],
+                seed_distance(seed_key, keys[index]),
+                index,
+            ),
+        )[:plate_size]
+
+        chosen_set = set(chosen)
+        remaining = [index for index in remaining if index not in chosen_set]
+        # Similar samples sit next to each other on the plate
+        chosen.sort(key=lambda index: (keys[index], index))
+        packed.append(list(zip(wells, [samples[index] for index in chosen])))
+
+    return packed
@@ -0,0 +1,68 @@
+import hashlib
+from enum import Enum
+
+from fastapi import Request, Response
+from sqlalchemy.dialects.postgresql import insert
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models import QueueVersion
+
+
+class Queue(str, Enum):
+    TO_PROCESS = "to_process"
+    TO_SHIP = "to_ship"
+
+
+async def bump_queue_versions(session: AsyncSession, *queues: Queue):
+    # Must run inside the writing transaction, so pollers never see a new
+    # version before the data behind it is committed
+    stmt = insert(QueueVersion).values(
+        [{"queue": queue.value, "version": 1} for queue in queues]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[QueueVersion.queue],
+        set_={"version": QueueVersion.version + 1},
+    )
+    await session.execute(stmt)
+
+
+async def get_queue_version(session: AsyncSession, queue: Queue) -> int:
+    stmt = select(QueueVersion.version).where(QueueVersion.queue == queue.value)
+    result = await session.execute(stmt)
+    return result.scalar_one_or_none() or 0
+
+
+async def check_not_modified(
+    request: Request,
+    response: Response,
+    session: AsyncSession,
+    queue: Queue,
+    *tag_inputs,
+) -> Response | None:
+    """
+    Set the queue ETag on the response and return a 304 response if the
+    client already holds the current version, so the caller can skip the
+    list query entirely.
+
+    `tag_inputs` are any other values the body depends on besides the queue
+    version, such as time-based cutoffs.
+    """
+    version = await get_queue_version(session, queue)
+    # The route and its parameters select a different body for the same
+    # queue version, so they are part of the tag
+    resource = (
+        f"{request.url.path}?{sorted(request.query_params.multi_items())}"
+        f"#{tag_inputs!r}"
+    )
+    digest = hashlib.blake2b(resource.encode(), digest_size=8).hexdigest()
+    # Weak, since the body may be sent with different content encodings
+    etag = f'W/"{queue.value}-{version}-{digest}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match == "*":
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return None
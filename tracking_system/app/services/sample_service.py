@@ -7,6 +7,9 @@ from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models import Sample, SampleStatus, QCResult, QCResults, Shipment
 from app.schemas.pydantic_models import (
+    PlateLayout,
+    PlateLayoutsResponse,
+    PlateWell,
     QCResultsInput,
     SampleToMake,
     SamplesToMakeResponse,
@@ -15,6 +18,13 @@ from app.schemas.pydantic_models import (
     SamplesShippedInput,
     SampleTATStatusResponse,
 )
+from app.services.plate_layout import (
+    MAX_QUEUE_AGE,
+    PlateFormat,
+    candidate_window,
+    pack_plates,
+)
+from app.services.queue_version import Queue, bump_queue_versions
 
 
 async def get_sample_tat_status(sample_uuid: UUID, session: AsyncSession):
@@ -67,6 +77,77 @@ async def get_samples_to_process(session: AsyncSession):
     return SamplesToMakeResponse(samples_to_make=samples_to_make)
 
 
+async def get_newest_overdue_created_at(
+    session: AsyncSession, overdue_before: datetime
+) -> datetime | None:
+    # Changes whenever another queued sample crosses MAX_QUEUE_AGE, even with
+    # no writes; one backward probe of the partial ORDERED index
+    stmt = (
+        select(Sample.created_at)
+        .where(Sample.status == SampleStatus.ORDERED)
+        .where(Sample.created_at <= overdue_before)
+        .order_by(Sample.created_at.desc())
+        .limit(1)
+    )
+    result = await session.execute(stmt)
+    return result.scalar_one_or_none()
+
+
+async def get_plate_layouts(
+    session: AsyncSession,
+    plate_format: PlateFormat,
+    plates: int = 1,
+    overdue_before: datetime | None = None,
+):
+    # Bounded oldest-first candidate window, served by the partial index on
+    # ORDERED samples, so the cost does not grow with the size of the queue
+    samples_query = (
+        select(
+            Sample.sample_uuid,
+            Sample.sequence,
+            Sample.created_at,
+            Sample.sequence_length,
+            Sample.gc_content,
+        )
+        .where(Sample.status == SampleStatus.ORDERED)
+        .outerjoin(QCResults)
+        .where(QCResults.qc_id == None)
+        .order_by(Sample.created_at)
+        .order_by(Sample.sample_uuid)
+        .limit(candidate_window(plate_format, plates))
+    )
+    result = await session.execute(samples_query)
+    samples = result.all()
+
+    if overdue_before is None:
+        overdue_before = datetime.utcnow() - MAX_QUEUE_AGE
+    packed = pack_plates(
+        samples,
+        plate_format,
+        plates,
+        lambda sample: (sample.sequence_length, sample.gc_content),
+        lambda sample: sample.created_at <= overdue_before,
+    )
+
+    layouts = [
+        PlateLayout(
+            plate_format=int(plate_format),
+            wells=[
+                PlateWell(
+                    well=well,
+                    sample_uuid=sample.sample_uuid,
+                    sequence=sample.sequence,
+                    created_at=sample.created_at.isoformat(),
+                )
+                for well, sample in plate
+            ],
+        )
+        for plate in packed
+    ]
+
+    return PlateLayoutsResponse(plates=layouts)
+
+
 async def log_qc_results(qc_results_input: QCResultsInput, session: AsyncSession):
     # Get all sample UUIDs from the input
     sample_uuids = [result.sample_uuid for result in qc_results_input.samples_made]
@@ -121,7 +202,9 @@ async def log_qc_results(qc_results_input: QCResultsInput, session: AsyncSession
             sample.status = SampleStatus.PASSED_QC
         else:
             sample.status = SampleStatus.FAILED
+        sample.updated_at = datetime.utcnow()
 
+    await bump_queue_versions(session, Queue.TO_PROCESS, Queue.TO_SHIP)
     await session.commit()
 
     return {"message": "QC results logged successfully"}
@@ -186,6 +269,7 @@ async def record_samples_shipped(
 
         shipped_samples.append(sample.sample_uuid)
 
+    await bump_queue_versions(session, Queue.TO_SHIP)
     await session.commit()
 
     return {"message": f"Successfully shipped samples: {shipped_samples}"}
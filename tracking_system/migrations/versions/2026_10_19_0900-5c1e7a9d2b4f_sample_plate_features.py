@@ -0,0 +1,53 @@
+"""sample plate features
+
+Revision ID: 5c1e7a9d2b4f
+Revises: 73be563f9f8d
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e7a9d2b4f'
+down_revision: str | None = '73be563f9f8d'
+branch_labels: str | list[str] | None = None
+depends_on: str | list[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column('sample', sa.Column('sequence_length', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('sample', sa.Column('gc_content', sa.Float(), server_default='0', nullable=False))
+
+    # Backfill features for samples created before this revision
+    op.execute(
+        """
+        UPDATE sample
+        SET sequence_length = length(sequence),
+            gc_content = COALESCE(
+                (length(sequence) - length(translate(upper(sequence), 'GC', '')))::float
+                / NULLIF(length(sequence), 0),
+                0
+            )
+        """
+    )
+
+    # Partial index covering the to-process queue, ordered oldest-first.
+    # Built concurrently so writes to a large sample table are not blocked.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_sample_ordered_created_at',
+            'sample',
+            ['created_at', 'sample_uuid'],
+            unique=False,
+            postgresql_where=sa.text("status = 'ORDERED'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_sample_ordered_created_at', table_name='sample', postgresql_concurrently=True)
+    op.drop_column('sample', 'gc_content')
+    op.drop_column('sample', 'sequence_length')
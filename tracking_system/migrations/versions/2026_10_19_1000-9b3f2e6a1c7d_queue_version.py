@@ -0,0 +1,29 @@
+"""queue version
+
+Revision ID: 9b3f2e6a1c7d
+Revises: 5c1e7a9d2b4f
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b3f2e6a1c7d'
+down_revision: str | None = '5c1e7a9d2b4f'
+branch_labels: str | list[str] | None = None
+depends_on: str | list[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table('queueversion',
+    sa.Column('queue', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('queue')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('queueversion')
@@ -0,0 +1,36 @@
+"""export watermark indexes
+
+Revision ID: 4e7a1d9c3b2f
+Revises: 9b3f2e6a1c7d
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e7a1d9c3b2f'
+down_revision: str | None = '9b3f2e6a1c7d'
+branch_labels: str | list[str] | None = None
+depends_on: str | list[str] | None = None
+
+
+def upgrade() -> None:
+    # Indexes for the incremental export filters. order and sample rows are
+    # updated in place, so their updated_at gets a B-tree; qcresults and
+    # shipment are append-only, where a much smaller BRIN index stays
+    # correlated. Built concurrently so writes are not blocked.
+    with op.get_context().autocommit_block():
+        op.create_index(op.f('ix_order_updated_at'), 'order', ['updated_at'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_sample_updated_at'), 'sample', ['updated_at'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_qcresults_created_at_brin', 'qcresults', ['created_at'], unique=False, postgresql_using='brin', postgresql_concurrently=True)
+        op.create_index('ix_shipment_shipped_at_brin', 'shipment', ['shipped_at'], unique=False, postgresql_using='brin', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_shipment_shipped_at_brin', table_name='shipment', postgresql_concurrently=True)
+        op.drop_index('ix_qcresults_created_at_brin', table_name='qcresults', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_sample_updated_at'), table_name='sample', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_order_updated_at'), table_name='order', postgresql_concurrently=True)
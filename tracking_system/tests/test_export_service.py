@@ -0,0 +1,199 @@
+import asyncio
+import io
+from contextlib import aclosing
+from datetime import datetime, timedelta, timezone
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.db import engine
+from app.services.export_service import (
+    COPY_QUEUE_SIZE,
+    ExportTable,
+    _arrow_schema,
+    _copy_csv,
+    _copy_statement,
+    _export_query,
+    _write_parquet,
+)
+
+
+def compile_query(query) -> str:
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+async def fake_batches(*batches):
+    for batch in batches:
+        yield batch
+
+
+async def collect(stream) -> bytes:
+    return b"".join([chunk async for chunk in stream])
+
+
+@pytest.mark.parametrize(
+    "table, watermark_column, primary_key",
+    [
+        (ExportTable.ORDER, '"order".updated_at', '"order".order_id'),
+        (ExportTable.SAMPLE, "sample.updated_at", "sample.sample_id"),
+        (ExportTable.QCRESULTS, "qcresults.created_at", "qcresults.qc_id"),
+        (ExportTable.SHIPMENT, "shipment.shipped_at", "shipment.shipment_id"),
+    ],
+)
+def test_export_query_filters_on_watermark_column(table, watermark_column, primary_key):
+    """
+    GIVEN each exportable table
+    WHEN an incremental export query is built
+    THEN it filters on the table's watermark column and orders by primary key
+    """
+    sql = compile_query(_export_query(table, datetime(2024, 10, 10)))
+
+    assert f"WHERE {watermark_column} >= " in sql
+    assert sql.endswith(f"ORDER BY {primary_key}")
+
+
+def test_export_query_casts_uuid_and_enum_columns():
+    """
+    GIVEN the sample table
+    WHEN a full export query is built
+    THEN UUID and enum columns are cast to text and no filter is applied
+    """
+    sql = compile_query(_export_query(ExportTable.SAMPLE, None))
+
+    assert "CAST(sample.sample_uuid AS VARCHAR) AS sample_uuid" in sql
+    assert "CAST(sample.status AS VARCHAR) AS status" in sql
+    assert "WHERE" not in sql
+
+
+def test_export_query_converts_aware_since_to_naive_utc():
+    """
+    GIVEN a timezone-aware watermark
+    WHEN an export query is built
+    THEN the bound parameter is the equivalent naive UTC datetime
+    """
+    since = datetime(2024, 10, 10, 12, tzinfo=timezone(timedelta(hours=2)))
+
+    params = _export_query(ExportTable.ORDER, since).compile().params
+
+    assert list(params.values()) == [datetime(2024, 10, 10, 10)]
+
+
+def test_copy_statement_uses_positional_parameters():
+    """
+    GIVEN an incremental export of the sample table
+    WHEN the COPY source query is compiled for asyncpg
+    THEN the watermark is passed as a positional parameter
+    """
+    since = datetime(2024, 10, 10)
+
+    sql, args = _copy_statement(ExportTable.SAMPLE, since, engine.dialect)
+
+    assert "WHERE sample.updated_at >= $1" in sql
+    assert args == [since]
+
+
+class FakeDriverConnection:
+    # Mimics asyncpg's copy_from_query by feeding chunks to `output`
+    def __init__(self, chunks, error=None):
+        self.chunks = chunks
+        self.error = error
+        self.copy_calls = []
+        self.cancelled = False
+
+    async def copy_from_query(self, sql, *args, output, format, header):
+        self.copy_calls.append((sql, args, format, header))
+        try:
+            for chunk in self.chunks:
+                await output(chunk)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.error:
+            raise self.error
+
+
+class FakeConnection:
+    def __init__(self, driver_connection):
+        self.dialect = engine.dialect
+        self.driver_connection = driver_connection
+
+    async def get_raw_connection(self):
+        return self
+
+
+def test_copy_csv_streams_postgres_output():
+    """
+    GIVEN Postgres returns COPY output in several chunks
+    WHEN CSV is streamed
+    THEN the chunks are passed through in order with a CSV header requested
+    """
+    driver = FakeDriverConnection([b"shipment_id,sample_id\n", b"1,10\n", b"2,11\n"])
+
+    body = asyncio.run(collect(_copy_csv(FakeConnection(driver), ExportTable.SHIPMENT, None)))
+
+    assert body == b"shipment_id,sample_id\n1,10\n2,11\n"
+    ((sql, args, format, header),) = driver.copy_calls
+    assert sql.startswith("SELECT shipment.shipment_id")
+    assert (args, format, header) == ((), "csv", True)
+
+
+def test_copy_csv_raises_copy_errors():
+    """
+    GIVEN COPY fails part way through
+    WHEN CSV is streamed
+    THEN the error reaches the consumer
+    """
+    driver = FakeDriverConnection([b"a\n"], error=RuntimeError("copy failed"))
+
+    with pytest.raises(RuntimeError, match="copy failed"):
+        asyncio.run(collect(_copy_csv(FakeConnection(driver), ExportTable.SHIPMENT, None)))
+
+
+def test_copy_csv_cancels_copy_when_closed_early():
+    """
+    GIVEN more COPY output than the buffer holds
+    WHEN the consumer stops after the first chunk
+    THEN the COPY is cancelled rather than left running
+    """
+    driver = FakeDriverConnection([b"x\n"] * (COPY_QUEUE_SIZE * 4))
+
+    async def read_one():
+        async with aclosing(_copy_csv(FakeConnection(driver), ExportTable.SHIPMENT, None)) as stream:
+            async for _ in stream:
+                break
+
+    asyncio.run(read_one())
+
+    assert driver.cancelled
+
+
+def test_arrow_schema_maps_column_types():
+    """
+    GIVEN the sample table
+    WHEN its Arrow schema is built
+    THEN each column maps to the matching Arrow type
+    """
+    schema = _arrow_schema(ExportTable.SAMPLE)
+
+    assert schema.field("sample_id").type == pa.int64()
+    assert schema.field("sample_uuid").type == pa.string()
+    assert schema.field("status").type == pa.string()
+    assert schema.field("gc_content").type == pa.float64()
+    assert schema.field("created_at").type == pa.timestamp("us")
+
+
+def test_write_parquet_across_batches():
+    """
+    GIVEN rows split over several batches
+    WHEN Parquet is written in chunks
+    THEN the chunks form one readable file with all rows
+    """
+    shipped_at = datetime(2024, 10, 10)
+    batches = fake_batches([(1, 10, shipped_at)], [(2, 11, shipped_at)])
+
+    body = asyncio.run(collect(_write_parquet(ExportTable.SHIPMENT, batches)))
+
+    table = pq.read_table(io.BytesIO(body))
+    assert table.column("shipment_id").to_pylist() == [1, 2]
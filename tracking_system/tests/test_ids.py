@@ -0,0 +1,28 @@
+import time
+from uuid import RFC_4122
+
+from app.ids import uuid7
+
+
+def test_uuid7_version_and_variant():
+    """
+    GIVEN
+    WHEN a UUIDv7 is generated
+    THEN it carries version 7 and the RFC 4122 variant
+    """
+    value = uuid7()
+    assert value.version == 7
+    assert value.variant == RFC_4122
+
+
+def test_uuid7_is_time_ordered():
+    """
+    GIVEN UUIDv7s generated in different milliseconds
+    WHEN they are compared
+    THEN they sort in creation order
+    """
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+    assert first < second
+    assert first.int >> 80 <= time.time_ns() // 1_000_000
@@ -0,0 +1,181 @@
+import asyncio
+import random
+from collections import namedtuple
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+from app.services.plate_layout import (
+    PlateFormat,
+    candidate_window,
+    compute_sequence_features,
+    layout_key,
+    pack_plates,
+    well_names,
+)
+from app.services.sample_service import get_plate_layouts
+
+# (age rank, sequence length, GC content, overdue)
+Sample = namedtuple("Sample", ["rank", "length", "gc", "overdue"])
+
+
+def pack(samples, plate_format=PlateFormat.PLATE_96, plates=1):
+    return pack_plates(
+        samples,
+        plate_format,
+        plates,
+        lambda sample: (sample.length, sample.gc),
+        lambda sample: sample.overdue,
+    )
+
+
+def make_samples(lengths, gc=0.5, overdue=0):
+    return [
+        Sample(rank, length, gc, rank < overdue) for rank, length in enumerate(lengths)
+    ]
+
+
+def length_buckets(plate):
+    return {layout_key(sample.length, sample.gc)[0] for _, sample in plate}
+
+
+def test_compute_sequence_features():
+    """
+    GIVEN a sequence with mixed case bases
+    WHEN features are computed
+    THEN length and GC fraction are returned
+    """
+    assert compute_sequence_features("ACgt") == (4, 0.5)
+    assert compute_sequence_features("") == (0, 0.0)
+
+
+def test_well_names():
+    """
+    GIVEN the supported plate formats
+    WHEN well names are generated
+    THEN one row-major name per well is returned
+    """
+    wells_96 = well_names(PlateFormat.PLATE_96)
+    assert len(wells_96) == 96
+    assert wells_96[:2] == ["A1", "A2"]
+    assert wells_96[-1] == "H12"
+
+    wells_384 = well_names(PlateFormat.PLATE_384)
+    assert len(wells_384) == 384
+    assert wells_384[-1] == "P24"
+
+
+def test_single_plate_from_mixed_queue():
+    """
+    GIVEN a window alternating short and long sequences
+    WHEN one 96-well plate is packed
+    THEN it holds only the oldest sample's length group, starting at A1
+    """
+    samples = make_samples([20 if i % 2 == 0 else 500 for i in range(768)])
+
+    (plate,) = pack(samples)
+
+    assert len(plate) == 96
+    assert {sample.length for _, sample in plate} == {20}
+    assert plate[0] == ("A1", samples[0])
+
+
+def test_multiple_plates_are_seeded_oldest_first():
+    """
+    GIVEN a window alternating short and long sequences
+    WHEN two 96-well plates are packed
+    THEN each plate holds a single length group
+    """
+    samples = make_samples([20 if i % 2 == 0 else 500 for i in range(1536)])
+
+    plates = pack(samples, plates=2)
+
+    assert [{sample.length for _, sample in plate} for plate in plates] == [{20}, {500}]
+
+
+def test_uniformly_mixed_queue_fills_every_plate():
+    """
+    GIVEN lengths uniform in 500-3000 nt and GC uniform in 0.3-0.7
+    WHEN plates are packed from a full candidate window
+    THEN every requested plate is built, around the oldest sample's length
+    """
+    rng = random.Random(0)
+    for plate_format, plates in [
+        (PlateFormat.PLATE_96, 1),
+        (PlateFormat.PLATE_96, 4),
+        (PlateFormat.PLATE_384, 1),
+    ]:
+        samples = [
+            Sample(rank, rng.randint(500, 3000), rng.uniform(0.3, 0.7), False)
+            for rank in range(candidate_window(plate_format, plates))
+        ]
+
+        packed = pack(samples, plate_format, plates)
+
+        assert [len(plate) for plate in packed] == [int(plate_format)] * plates
+        assert samples[0] in [sample for _, sample in packed[0]]
+        # Filling outwards by length keeps each plate to a narrow band
+        assert all(max(length_buckets(plate)) - min(length_buckets(plate)) <= 6 for plate in packed)
+
+
+def test_gc_breaks_ties_within_length_distance():
+    """
+    GIVEN samples of one length and two GC levels
+    WHEN one plate is packed
+    THEN the seed's GC level is preferred, regardless of age
+    """
+    samples = [Sample(0, 100, 0.5, False)]
+    samples += [Sample(rank, 100, 0.7, False) for rank in range(1, 101)]
+    samples += [Sample(rank, 100, 0.5, False) for rank in range(101, 196)]
+
+    (plate,) = pack(samples)
+
+    assert {sample.gc for _, sample in plate} == {0.5}
+
+
+def test_overdue_samples_are_not_starved():
+    """
+    GIVEN the oldest samples are overdue and have a rare length
+    WHEN one plate is packed
+    THEN they are placed, topped up from the nearest lengths
+    """
+    samples = make_samples([1000] * 5 + [20] * 200 + [900] * 3, overdue=5)
+
+    (plate,) = pack(samples)
+
+    placed = [sample for _, sample in plate]
+    assert set(samples[:5]) <= set(placed)
+    # The 900 nt samples are nearest to the 1000 nt seed
+    assert set(samples[-3:]) <= set(placed)
+
+
+def test_partial_plate_is_not_built():
+    """
+    GIVEN fewer samples than a plate holds
+    WHEN one plate is packed
+    THEN no plate is returned
+    """
+    assert pack(make_samples([20] * 95)) == []
+
+
+def test_get_plate_layouts_reads_candidate_window(fake_session):
+    """
+    GIVEN an ORDERED queue
+    WHEN plate layouts are requested
+    THEN the candidate window is queried and packed into a response
+    """
+    start = datetime.utcnow() - timedelta(hours=1)
+    Row = namedtuple(
+        "Row", ["sample_uuid", "sequence", "created_at", "sequence_length", "gc_content"]
+    )
+    rows = [Row(uuid4(), "A" * 20, start + timedelta(seconds=i), 20, 0.0) for i in range(100)]
+    fake_session.respond = lambda stmt: rows
+
+    response = asyncio.run(get_plate_layouts(fake_session, PlateFormat.PLATE_96))
+
+    (stmt,) = fake_session.statements
+    sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    assert sql.endswith(f"LIMIT {candidate_window(PlateFormat.PLATE_96, 1)}")
+    assert len(response.plates) == 1
+    assert response.plates[0].wells[0].sample_uuid == rows[0].sample_uuid
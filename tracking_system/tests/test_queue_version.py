@@ -0,0 +1,158 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from starlette.testclient import TestClient
+
+from app.db import get_session
+from app.main import app
+from app.models import SampleStatus
+from app.services.queue_version import Queue, bump_queue_versions
+
+
+class QueueState:
+    # What the fake database holds for the polling queries
+    def __init__(self):
+        self.version = 3
+        self.newest_overdue = None
+        self.samples = []
+
+    def respond(self, stmt):
+        sql = str(stmt)
+        if "queueversion" in sql:
+            return self.version
+        if "DESC" in sql:
+            return self.newest_overdue
+        return self.samples
+
+
+@pytest.fixture
+def state(fake_session):
+    state = QueueState()
+    fake_session.respond = state.respond
+    return state
+
+
+@pytest.fixture
+def client(fake_session, state):
+    async def override_get_session():
+        yield fake_session
+
+    app.dependency_overrides[get_session] = override_get_session
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_mismatch_returns_body_with_etag(client, fake_session):
+    """
+    GIVEN a client without the current tag
+    WHEN the to-process queue is polled
+    THEN the list is returned with an ETag for the current version
+    """
+    response = client.get("/samples/to-process/", headers={"If-None-Match": 'W/"stale"'})
+
+    assert response.status_code == 200
+    assert response.json() == {"samples_to_make": []}
+    assert response.headers["ETag"].startswith('W/"to_process-3-')
+    assert len(fake_session.statements) == 2
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    ["{etag}", "*", 'W/"to_process-1-0000", {etag}'],
+)
+def test_match_returns_304_without_list_query(client, fake_session, if_none_match):
+    """
+    GIVEN a client holding the current tag (alone, as "*" or in a list)
+    WHEN the to-process queue is polled again
+    THEN 304 is returned and the list query is not run
+    """
+    etag = client.get("/samples/to-process/").headers["ETag"]
+    fake_session.statements.clear()
+
+    response = client.get(
+        "/samples/to-process/",
+        headers={"If-None-Match": if_none_match.format(etag=etag)},
+    )
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert len(fake_session.statements) == 1
+
+
+def test_etag_depends_on_route_and_parameters(client):
+    """
+    GIVEN the same to-process queue version
+    WHEN different routes or parameters are polled
+    THEN each gets its own tag, so a reused tag cannot produce a wrong 304
+    """
+    to_process = client.get("/samples/to-process/").headers["ETag"]
+    default_layout = client.get("/samples/plate-layout/").headers["ETag"]
+    large_layout = client.get(
+        "/samples/plate-layout/", params={"plate_format": 384, "plates": 4}
+    ).headers["ETag"]
+
+    assert len({to_process, default_layout, large_layout}) == 3
+
+    response = client.get(
+        "/samples/plate-layout/",
+        params={"plate_format": 384, "plates": 4},
+        headers={"If-None-Match": default_layout},
+    )
+    assert response.status_code == 200
+
+
+def test_large_poll_body_is_gzipped(client, state):
+    """
+    GIVEN a to-process list larger than the compression threshold
+    WHEN it is polled with gzip accepted
+    THEN the body is gzip-encoded
+    """
+    state.samples = [
+        SimpleNamespace(
+            sample_uuid=uuid4(),
+            sequence="ACGT" * 10,
+            created_at=datetime(2024, 10, 10),
+            status=SampleStatus.ORDERED,
+        )
+        for _ in range(50)
+    ]
+
+    response = client.get("/samples/to-process/", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert len(response.json()["samples_to_make"]) == 50
+
+
+def test_plate_layout_etag_changes_when_samples_become_overdue(client, state):
+    """
+    GIVEN a quiet queue whose version does not change
+    WHEN another sample crosses the overdue age between polls
+    THEN the plate layout tag changes, so the poller gets the new layout
+    """
+    etag = client.get("/samples/plate-layout/").headers["ETag"]
+
+    unchanged = client.get("/samples/plate-layout/", headers={"If-None-Match": etag})
+    state.newest_overdue = datetime(2024, 10, 10)
+    changed = client.get("/samples/plate-layout/", headers={"If-None-Match": etag})
+
+    assert unchanged.status_code == 304
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+
+
+def test_bump_queue_versions_upserts_each_queue(fake_session):
+    """
+    GIVEN a writing transaction
+    WHEN queue versions are bumped
+    THEN a single upsert increments every named queue
+    """
+    asyncio.run(bump_queue_versions(fake_session, Queue.TO_PROCESS, Queue.TO_SHIP))
+
+    (stmt,) = fake_session.statements
+    compiled = stmt.compile(dialect=postgresql.dialect())
+    assert "ON CONFLICT (queue) DO UPDATE SET version = (queueversion.version + " in str(compiled)
+    assert set(compiled.params.values()) >= {"to_process", "to_ship"}